@@ -16,6 +16,20 @@ import {
   ContactWithRelations,
 } from './contact-types'
 
+// camelCase -> snake_case sort column mapping, hoisted to module scope.
+// Doubles as the SQL-injection whitelist: unknown fields miss the map and
+// fall back to created_at, so a single lookup replaces the old
+// includes() scan + map lookup pair.
+const SORT_COLUMN_MAP: Record<string, string> = {
+  createdAt: 'c.created_at',
+  updatedAt: 'c.updated_at',
+  firstName: 'c.first_name',
+  lastName: 'c.last_name',
+  email: 'c.email',
+  leadScore: 'c.lead_score',
+  lastContactedAt: 'c.last_contacted_at',
+}
+
 export class ContactRepository {
   private pool: Pool
 
@@ -80,8 +94,11 @@ export class ContactRepository {
    * Find contact by ID
    */
   async findById(id: string, tenantId: string): Promise<Contact | null> {
-    const result = await this.pool.query<Contact>(
-      `SELECT
+    // Named statement: pg prepares it once per pooled connection, so repeat
+    // lookups skip parse/plan
+    const result = await this.pool.query<Contact>({
+      name: 'contact_find_by_id',
+      text: `SELECT
         id, tenant_id as "tenantId", owner_id as "ownerId", account_id as "accountId",
         first_name as "firstName", last_name as "lastName", email, phone, mobile,
         title, department, lead_source as "leadSource", lead_status as "leadStatus",
@@ -94,8 +111,8 @@ export class ContactRepository {
         created_at as "createdAt", updated_at as "updatedAt", deleted_at as "deletedAt"
       FROM contacts
       WHERE id = $1 AND tenant_id = $2 AND deleted_at IS NULL`,
-      [id, tenantId]
-    )
+      values: [id, tenantId],
+    })
 
     return result.rows[0] || null
   }
@@ -242,41 +259,18 @@ export class ContactRepository {
 
     const whereClause = whereClauses.join(' AND ')
 
-    // Validate sortBy to prevent SQL injection
-    const allowedSortFields = [
-      'createdAt',
-      'updatedAt',
-      'firstName',
-      'lastName',
-      'email',
-      'leadScore',
-      'lastContactedAt',
-    ]
-    const sortField = allowedSortFields.includes(sortBy) ? sortBy : 'createdAt'
+    // Validate sortBy to prevent SQL injection; the own-property check keeps
+    // prototype builtins (constructor, toString, ...) out of ORDER BY
+    const sortColumn = Object.hasOwn(SORT_COLUMN_MAP, sortBy)
+      ? SORT_COLUMN_MAP[sortBy]
+      : SORT_COLUMN_MAP.createdAt
     const sortDirection = sortOrder === 'asc' ? 'ASC' : 'DESC'
 
-    // Map camelCase to snake_case for database
-    const sortColumnMap: Record<string, string> = {
-      createdAt: 'c.created_at',
-      updatedAt: 'c.updated_at',
-      firstName: 'c.first_name',
-      lastName: 'c.last_name',
-      email: 'c.email',
-      leadScore: 'c.lead_score',
-      lastContactedAt: 'c.last_contacted_at',
-    }
-    const sortColumn = sortColumnMap[sortField]
-
-    // Get total count
-    const countResult = await this.pool.query(
-      `SELECT COUNT(*) FROM contacts c WHERE ${whereClause}`,
-      [tenantId]
-    )
-    const total = parseInt(countResult.rows[0].count, 10)
-
-    // Get contacts
-    const result = await this.pool.query<Contact>(
-      `SELECT
+    // Rows and total count in one round trip: COUNT(*) OVER() evaluates the
+    // filtered count alongside the page instead of re-running the WHERE
+    // clause in a separate query
+    const listQuery = `SELECT
+        COUNT(*) OVER()::int as "totalCount",
         c.id, c.tenant_id as "tenantId", c.owner_id as "ownerId", c.account_id as "accountId",
         c.first_name as "firstName", c.last_name as "lastName", c.email, c.phone, c.mobile,
         c.title, c.department, c.lead_source as "leadSource", c.lead_status as "leadStatus",
@@ -290,12 +284,26 @@ export class ContactRepository {
       FROM contacts c
       WHERE ${whereClause}
       ORDER BY ${sortColumn} ${sortDirection}
-      LIMIT $2 OFFSET $3`,
-      queryParams
-    )
+      LIMIT $2 OFFSET $3`
+
+    const result = await this.pool.query<Contact & { totalCount: number }>(listQuery, queryParams)
+
+    let total = result.rows.length > 0 ? result.rows[0].totalCount : 0
+
+    // A page past the last matching row returns no rows and loses the window
+    // count; re-run for a single row at offset 0 so the true total is reported
+    if (result.rows.length === 0 && page > 1) {
+      const countParams = [...queryParams]
+      countParams[1] = 1
+      countParams[2] = 0
+      const countResult = await this.pool.query<{ totalCount: number }>(listQuery, countParams)
+      total = countResult.rows.length > 0 ? countResult.rows[0].totalCount : 0
+    }
+
+    const contacts = result.rows.map(({ totalCount, ...contact }) => contact as Contact)
 
     return {
-      contacts: result.rows,
+      contacts,
       total,
       page,
       limit,
@@ -386,8 +394,9 @@ export class ContactRepository {
    * Search contacts with full-text search
    */
   async search(tenantId: string, query: string, limit: number = 20): Promise<Contact[]> {
-    const result = await this.pool.query<Contact>(
-      `SELECT
+    const result = await this.pool.query<Contact>({
+      name: 'contact_fts_search',
+      text: `SELECT
         id, tenant_id as "tenantId", owner_id as "ownerId", account_id as "accountId",
         first_name as "firstName", last_name as "lastName", email, phone, mobile,
         title, department, lead_source as "leadSource", lead_status as "leadStatus",
@@ -420,8 +429,8 @@ export class ContactRepository {
             ) @@ plainto_tsquery('english', $2)
       ORDER BY rank DESC
       LIMIT $3`,
-      [tenantId, query, limit]
-    )
+      values: [tenantId, query, limit],
+    })
 
     return result.rows
   }
@@ -19,6 +19,20 @@ import {
   PipelineWithStages,
 } from './deal-types'
 
+// camelCase -> snake_case sort column mapping, hoisted to module scope.
+// Doubles as the SQL-injection whitelist: unknown fields miss the map and
+// fall back to created_at, so a single lookup replaces the old
+// includes() scan
+const SORT_COLUMN_MAP: Record<string, string> = {
+  createdAt: 'd.created_at',
+  updatedAt: 'd.updated_at',
+  name: 'd.name',
+  amount: 'd.amount',
+  weightedAmount: 'd.weighted_amount',
+  probability: 'd.probability',
+  expectedCloseDate: 'd.expected_close_date',
+}
+
 export class DealRepository {
   private pool: Pool
 
@@ -99,8 +113,11 @@ export class DealRepository {
    * Find deal by ID
    */
   async findById(id: string, tenantId: string): Promise<Deal | null> {
-    const result = await this.pool.query<Deal>(
-      `SELECT
+    // Named statement: pg prepares it once per pooled connection, so repeat
+    // lookups skip parse/plan
+    const result = await this.pool.query<Deal>({
+      name: 'deal_find_by_id',
+      text: `SELECT
         id,
         tenant_id as "tenantId",
         owner_id as "ownerId",
@@ -132,8 +149,8 @@ export class DealRepository {
         deleted_at as "deletedAt"
       FROM deals
       WHERE id = $1 AND tenant_id = $2 AND deleted_at IS NULL`,
-      [id, tenantId]
-    )
+      values: [id, tenantId],
+    })
 
     return result.rows[0] || null
   }
@@ -300,22 +317,17 @@ export class DealRepository {
     const whereClause = whereClauses.join(' AND ')
     const offset = (page - 1) * limit
 
-    // Get total count
-    const countResult = await this.pool.query(
-      `SELECT COUNT(*) as total FROM deals d WHERE ${whereClause}`,
-      params
-    )
-    const total = parseInt(countResult.rows[0].total, 10)
-
-    // Get paginated results
-    const validSortColumns = [
-      'createdAt', 'updatedAt', 'name', 'amount', 'weightedAmount', 'probability', 'expectedCloseDate'
-    ]
-    const sortColumn = validSortColumns.includes(sortBy) ? sortBy : 'createdAt'
+    // Get paginated results (whitelist-map own-property check validates
+    // sortBy and keeps prototype builtins out of ORDER BY); COUNT(*) OVER()
+    // returns the filtered total with the page itself, so no separate count
+    // round trip is needed
+    const sortColumn = Object.hasOwn(SORT_COLUMN_MAP, sortBy)
+      ? SORT_COLUMN_MAP[sortBy]
+      : SORT_COLUMN_MAP.createdAt
     const sortDirection = sortOrder === 'asc' ? 'ASC' : 'DESC'
 
-    const result = await this.pool.query<Deal>(
-      `SELECT
+    const listQuery = `SELECT
+        COUNT(*) OVER()::int as "totalCount",
         id,
         tenant_id as "tenantId",
         owner_id as "ownerId",
@@ -348,14 +360,28 @@ export class DealRepository {
       FROM deals d
       WHERE ${whereClause}
       ORDER BY ${sortColumn} ${sortDirection}
-      LIMIT $${paramIndex} OFFSET $${paramIndex + 1}`,
-      [...params, limit, offset]
-    )
+      LIMIT $${paramIndex} OFFSET $${paramIndex + 1}`
+
+    const result = await this.pool.query<Deal & { totalCount: number }>(listQuery, [
+      ...params,
+      limit,
+      offset,
+    ])
+
+    let total = result.rows.length > 0 ? result.rows[0].totalCount : 0
+
+    // A page past the last matching row returns no rows and loses the window
+    // count; re-run for a single row at offset 0 so the true total is reported
+    if (result.rows.length === 0 && page > 1) {
+      const countResult = await this.pool.query<{ totalCount: number }>(listQuery, [...params, 1, 0])
+      total = countResult.rows.length > 0 ? countResult.rows[0].totalCount : 0
+    }
 
+    const deals = result.rows.map(({ totalCount, ...deal }) => deal as Deal)
     const totalPages = Math.ceil(total / limit)
 
     return {
-      deals: result.rows,
+      deals,
       total,
       page,
       limit,
@@ -498,6 +524,41 @@ export class DealRepository {
     return result.rows
   }
 
+  /**
+   * Get aggregate deal statistics in a single query
+   * FILTER aggregates compute counts/sums server-side so callers do not need
+   * to fetch and iterate every deal
+   */
+  async getStatisticsAggregates(tenantId: string): Promise<{
+    totalDeals: number
+    openDeals: number
+    closedDeals: number
+    wonDeals: number
+    lostDeals: number
+    totalValue: number
+    wonValue: number
+    lostValue: number
+    weightedPipelineValue: number
+  }> {
+    const result = await this.pool.query(
+      `SELECT
+        COUNT(*)::int as "totalDeals",
+        COUNT(*) FILTER (WHERE is_closed IS NOT TRUE)::int as "openDeals",
+        COUNT(*) FILTER (WHERE is_closed IS TRUE)::int as "closedDeals",
+        COUNT(*) FILTER (WHERE is_won IS TRUE)::int as "wonDeals",
+        COUNT(*) FILTER (WHERE is_won IS FALSE)::int as "lostDeals",
+        COALESCE(SUM(amount), 0)::float as "totalValue",
+        COALESCE(SUM(amount) FILTER (WHERE is_won IS TRUE), 0)::float as "wonValue",
+        COALESCE(SUM(amount) FILTER (WHERE is_won IS FALSE), 0)::float as "lostValue",
+        COALESCE(SUM(weighted_amount), 0)::float as "weightedPipelineValue"
+      FROM deals
+      WHERE tenant_id = $1 AND deleted_at IS NULL`,
+      [tenantId]
+    )
+
+    return result.rows[0]
+  }
+
   /**
    * Bulk delete deals
    */
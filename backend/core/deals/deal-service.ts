@@ -509,55 +509,30 @@ export class DealService {
    * Get deal statistics
    */
   async getStatistics(tenantId: string): Promise<DealStatistics> {
-    // Get all deals for statistics calculation
-    const allDeals = await dealRepository.list(tenantId, {
+    // Aggregates are computed in SQL; only the top deals are materialized
+    const aggregates = await dealRepository.getStatisticsAggregates(tenantId)
+    const topDeals = await dealRepository.list(tenantId, {
       page: 1,
-      limit: 10000, // Get all for statistics
+      limit: 10,
+      sortBy: 'amount',
+      sortOrder: 'desc',
     })
 
-    const total = allDeals.total
-    const open = allDeals.deals.filter((d) => !d.isClosed).length
-    const closed = allDeals.deals.filter((d) => d.isClosed).length
-    const won = allDeals.deals.filter((d) => d.isWon === true).length
-    const lost = allDeals.deals.filter((d) => d.isWon === false).length
-
-    let totalValue = 0
-    let wonValue = 0
-    let lostValue = 0
-    let weightedValue = 0
-
-    allDeals.deals.forEach((deal) => {
-      if (deal.amount) {
-        totalValue += deal.amount
-        if (deal.isWon) wonValue += deal.amount
-        if (deal.isWon === false) lostValue += deal.amount
-      }
-      if (deal.weightedAmount) {
-        weightedValue += deal.weightedAmount
-      }
-    })
-
-    const averageDealSize = total > 0 ? totalValue / total : 0
-    const winRate = closed > 0 ? (won / closed) * 100 : 0
+    const averageDealSize =
+      aggregates.totalDeals > 0 ? aggregates.totalValue / aggregates.totalDeals : 0
+    const winRate =
+      aggregates.closedDeals > 0 ? (aggregates.wonDeals / aggregates.closedDeals) * 100 : 0
     const averageSalesCycle = 30 // TODO: Calculate from actual data
 
     return {
-      totalDeals: total,
-      openDeals: open,
-      closedDeals: closed,
-      wonDeals: won,
-      lostDeals: lost,
-      totalValue,
-      wonValue,
-      lostValue,
-      weightedPipelineValue: weightedValue,
+      ...aggregates,
       averageDealSize,
       winRate,
       averageSalesCycle,
       byStage: {},
       byPipeline: {},
       byOwner: {},
-      topDeals: allDeals.deals.slice(0, 10),
+      topDeals: topDeals.deals,
       dealsClosingSoon: [],
       staleDealeddeals: [],
     }
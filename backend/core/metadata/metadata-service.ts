@@ -545,6 +545,30 @@ export class TagService {
 // CUSTOM FIELD SERVICE
 // =====================================================
 
+// Compiled validation-pattern cache: custom-field patterns are defined once
+// per field but applied on every record write, so compile each pattern a
+// single time instead of per validation call
+const compiledPatternCache = new Map<string, RegExp>()
+const PATTERN_CACHE_MAX = 256
+
+// Validation patterns are tenant-authored, so a backtracking-heavy pattern
+// against an unbounded value is a ReDoS vector. Values longer than this are
+// rejected outright rather than tested; no legitimate custom-field format
+// check needs more.
+const PATTERN_INPUT_MAX = 8192
+
+function getCompiledPattern(pattern: string): RegExp {
+  let regex = compiledPatternCache.get(pattern)
+  if (!regex) {
+    regex = new RegExp(pattern)
+    if (compiledPatternCache.size >= PATTERN_CACHE_MAX) {
+      compiledPatternCache.clear()
+    }
+    compiledPatternCache.set(pattern, regex)
+  }
+  return regex
+}
+
 export class CustomFieldService {
   /**
    * Create a new custom field definition
@@ -852,7 +876,12 @@ export class CustomFieldService {
 
     // Pattern matching
     if (rules.pattern) {
-      const regex = new RegExp(rules.pattern)
+      if (value.length > PATTERN_INPUT_MAX) {
+        throw new ValidationError(
+          `${fieldLabel} must be at most ${PATTERN_INPUT_MAX} characters to be validated against the required format`
+        )
+      }
+      const regex = getCompiledPattern(rules.pattern)
       if (!regex.test(value)) {
         throw new ValidationError(
           `${fieldLabel} does not match the required format${rules.patternMessage ? ': ' + rules.patternMessage : ''}`
@@ -0,0 +1,26 @@
+-- ============================================================================
+-- Full-Text Search Indexes
+-- ============================================================================
+-- The contact and deal search queries match on to_tsvector expressions.
+-- Without expression indexes PostgreSQL recomputes the tsvector for every row
+-- on every search (a sequential scan). These GIN indexes mirror the exact
+-- expressions used by the search queries so the planner can use them.
+
+-- Contacts full-text search (contact-repository search())
+CREATE INDEX IF NOT EXISTS idx_contacts_fts ON contacts USING GIN (
+    to_tsvector('english',
+        COALESCE(first_name, '') || ' ' ||
+        COALESCE(last_name, '') || ' ' ||
+        COALESCE(email, '') || ' ' ||
+        COALESCE(title, '') || ' ' ||
+        COALESCE(department, '')
+    )
+);
+
+-- Deals full-text search (deal-repository search())
+CREATE INDEX IF NOT EXISTS idx_deals_fts ON deals USING GIN (
+    to_tsvector('english',
+        COALESCE(name, '') || ' ' ||
+        COALESCE(description, '')
+    )
+);
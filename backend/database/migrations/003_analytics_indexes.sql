@@ -0,0 +1,22 @@
+-- ============================================================================
+-- Composite Indexes for Analytics and Timeline Queries
+-- ============================================================================
+-- Forecast/pipeline queries filter deals by stage and expected close date,
+-- timeline lookups fetch the most recent activities for one record, and the
+-- upcoming-tasks query filters open tasks ordered by due date. The single
+-- column indexes from 001 leave these as scan + sort plans; the composites
+-- below turn them into index range scans with index-backed ordering.
+
+CREATE INDEX IF NOT EXISTS idx_deals_stage_close
+    ON deals(stage, expected_close_date);
+
+CREATE INDEX IF NOT EXISTS idx_activities_related_created
+    ON activities(related_to_type, related_to_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_tasks_status_due
+    ON tasks(status, due_date);
+
+-- Refresh planner statistics so the new indexes are picked up immediately
+ANALYZE deals;
+ANALYZE activities;
+ANALYZE tasks;
@@ -35,6 +35,36 @@ export interface ActionResult {
   error?: string;
 }
 
+// Keywords that indicate action intent, hoisted so shouldExecuteAction does
+// not rebuild the list per message
+const ACTION_KEYWORDS = [
+  'create', 'add', 'new', 'make',
+  'update', 'change', 'modify', 'edit',
+  'delete', 'remove',
+  'send', 'email',
+  'search', 'find', 'show', 'get', 'list',
+  'complete', 'finish', 'done',
+];
+
+// Static portion of the system prompt; only the current date varies per call
+const SYSTEM_PROMPT_BASE = `You are Albedo, an AI assistant integrated into ClientForge CRM. You have the ability to execute actions on behalf of the user.
+
+Your capabilities include:
+- Creating, updating, and searching contacts
+- Managing deals and opportunities
+- Creating and completing tasks
+- Sending emails
+- Querying CRM data and statistics
+
+When a user asks you to perform an action, use the appropriate tools to execute it. After executing tools, provide a clear confirmation message summarizing what was done.
+
+Guidelines:
+1. Always confirm what action you're taking before executing
+2. If information is missing, ask clarifying questions
+3. After executing actions, provide clear feedback about what was done
+4. If an action fails, explain why and suggest alternatives
+5. Be proactive in suggesting related actions that might be helpful`;
+
 export class AIActionExecutor {
   private client: Anthropic;
 
@@ -101,48 +131,57 @@ export class AIActionExecutor {
         };
       }
 
-      // Execute each tool
-      const toolResults: any[] = [];
-
-      for (const toolUse of toolUses) {
-        try {
-          const tool = getToolByName(toolUse.name);
-
-          if (!tool) {
-            throw new Error(`Unknown tool: ${toolUse.name}`);
+      // Execute the tools concurrently - tool uses within one assistant turn
+      // are independent of each other. Promise.all preserves ordering so
+      // actions/toolResults line up with the original tool_use blocks.
+      const executed = await Promise.all(
+        toolUses.map(async (toolUse: any) => {
+          try {
+            const tool = getToolByName(toolUse.name);
+
+            if (!tool) {
+              throw new Error(`Unknown tool: ${toolUse.name}`);
+            }
+
+            const result = await tool.execute(toolUse.input, toolContext);
+
+            return {
+              action: {
+                tool: toolUse.name,
+                parameters: toolUse.input,
+                result: result,
+                success: true,
+              },
+              toolResult: {
+                type: 'tool_result',
+                tool_use_id: toolUse.id,
+                content: JSON.stringify(result),
+              },
+            };
+          } catch (error: any) {
+            return {
+              action: {
+                tool: toolUse.name,
+                parameters: toolUse.input,
+                result: null,
+                success: false,
+                error: error.message,
+              },
+              toolResult: {
+                type: 'tool_result',
+                tool_use_id: toolUse.id,
+                content: JSON.stringify({ error: error.message }),
+                is_error: true,
+              },
+            };
           }
+        })
+      );
 
-          // Execute the tool
-          const result = await tool.execute(toolUse.input, toolContext);
-
-          actions.push({
-            tool: toolUse.name,
-            parameters: toolUse.input,
-            result: result,
-            success: true,
-          });
-
-          toolResults.push({
-            type: 'tool_result',
-            tool_use_id: toolUse.id,
-            content: JSON.stringify(result),
-          });
-        } catch (error: any) {
-          actions.push({
-            tool: toolUse.name,
-            parameters: toolUse.input,
-            result: null,
-            success: false,
-            error: error.message,
-          });
-
-          toolResults.push({
-            type: 'tool_result',
-            tool_use_id: toolUse.id,
-            content: JSON.stringify({ error: error.message }),
-            is_error: true,
-          });
-        }
+      const toolResults: any[] = [];
+      for (const { action, toolResult } of executed) {
+        actions.push(action);
+        toolResults.push(toolResult);
       }
 
       // Send tool results back to Claude to get final response
@@ -184,41 +223,15 @@ export class AIActionExecutor {
    * Returns true if Claude should use tools, false for just chat
    */
   async shouldExecuteAction(message: string): Promise<boolean> {
-    // Keywords that indicate action intent
-    const actionKeywords = [
-      'create', 'add', 'new', 'make',
-      'update', 'change', 'modify', 'edit',
-      'delete', 'remove',
-      'send', 'email',
-      'search', 'find', 'show', 'get', 'list',
-      'complete', 'finish', 'done',
-    ];
-
     const lowerMessage = message.toLowerCase();
-    return actionKeywords.some((keyword) => lowerMessage.includes(keyword));
+    return ACTION_KEYWORDS.some((keyword) => lowerMessage.includes(keyword));
   }
 
   /**
    * Build system prompt explaining Albedo's capabilities
    */
   private buildSystemPrompt(): string {
-    return `You are Albedo, an AI assistant integrated into ClientForge CRM. You have the ability to execute actions on behalf of the user.
-
-Your capabilities include:
-- Creating, updating, and searching contacts
-- Managing deals and opportunities
-- Creating and completing tasks
-- Sending emails
-- Querying CRM data and statistics
-
-When a user asks you to perform an action, use the appropriate tools to execute it. After executing tools, provide a clear confirmation message summarizing what was done.
-
-Guidelines:
-1. Always confirm what action you're taking before executing
-2. If information is missing, ask clarifying questions
-3. After executing actions, provide clear feedback about what was done
-4. If an action fails, explain why and suggest alternatives
-5. Be proactive in suggesting related actions that might be helpful
+    return `${SYSTEM_PROMPT_BASE}
 
 Current date: ${new Date().toISOString().split('T')[0]}
 
@@ -69,6 +69,8 @@ export const createContactTool: AITool = {
       ]
     );
 
+    statsCache.delete(context.userId);
+
     return {
       success: true,
       contactId: result.lastID,
@@ -77,6 +79,17 @@ export const createContactTool: AITool = {
   },
 };
 
+// Updatable contact fields: single param -> column dispatch table instead of
+// a per-field branch cascade in the tool body
+const CONTACT_UPDATE_FIELDS: Record<string, string> = {
+  firstName: 'first_name',
+  lastName: 'last_name',
+  email: 'email',
+  phone: 'phone',
+  company: 'company',
+  title: 'title',
+};
+
 export const updateContactTool: AITool = {
   name: 'update_contact',
   description: 'Update an existing contact',
@@ -97,29 +110,11 @@ export const updateContactTool: AITool = {
     const updates: string[] = [];
     const values: any[] = [];
 
-    if (params.firstName) {
-      updates.push('first_name = ?');
-      values.push(params.firstName);
-    }
-    if (params.lastName) {
-      updates.push('last_name = ?');
-      values.push(params.lastName);
-    }
-    if (params.email) {
-      updates.push('email = ?');
-      values.push(params.email);
-    }
-    if (params.phone) {
-      updates.push('phone = ?');
-      values.push(params.phone);
-    }
-    if (params.company) {
-      updates.push('company = ?');
-      values.push(params.company);
-    }
-    if (params.title) {
-      updates.push('title = ?');
-      values.push(params.title);
+    for (const [param, column] of Object.entries(CONTACT_UPDATE_FIELDS)) {
+      if (params[param]) {
+        updates.push(`${column} = ?`);
+        values.push(params[param]);
+      }
     }
 
     updates.push("updated_at = datetime('now')");
@@ -150,19 +145,19 @@ export const searchContactsTool: AITool = {
   },
   execute: async (params, context) => {
     const limit = params.limit || 10;
-    const searchTerm = `%${params.query}%`;
 
+    // Case-insensitive substring match: agent queries are typically short
+    // prefixes or fragments ("Joh", "acme.com") that word-based full-text
+    // matching would miss
+    const pattern = `%${params.query}%`;
     const contacts = await dbAll(
       `SELECT id, first_name, last_name, email, phone, company, title
        FROM contacts
-       WHERE user_id = ? AND (
-         first_name LIKE ? OR
-         last_name LIKE ? OR
-         email LIKE ? OR
-         company LIKE ?
-       )
+       WHERE user_id = ?
+         AND (first_name ILIKE ? OR last_name ILIKE ? OR email ILIKE ? OR company ILIKE ?)
+       ORDER BY last_name, first_name
        LIMIT ?`,
-      [context.userId, searchTerm, searchTerm, searchTerm, searchTerm, limit]
+      [context.userId, pattern, pattern, pattern, pattern, limit]
     );
 
     return {
@@ -208,6 +203,8 @@ export const createDealTool: AITool = {
       ]
     );
 
+    statsCache.delete(context.userId);
+
     return {
       success: true,
       dealId: result.lastID,
@@ -235,6 +232,8 @@ export const updateDealStageTool: AITool = {
       [params.stage, params.probability || null, params.dealId, context.userId]
     );
 
+    statsCache.delete(context.userId);
+
     return {
       success: true,
       message: `Deal moved to ${params.stage}`,
@@ -277,6 +276,8 @@ export const createTaskTool: AITool = {
       ]
     );
 
+    statsCache.delete(context.userId);
+
     return {
       success: true,
       taskId: result.lastID,
@@ -302,6 +303,8 @@ export const completeTaskTool: AITool = {
       [params.taskId, context.userId]
     );
 
+    statsCache.delete(context.userId);
+
     return {
       success: true,
       message: `Task marked as completed`,
@@ -365,6 +368,20 @@ export const sendEmailTool: AITool = {
 // DATA QUERY TOOLS
 // =====================================================
 
+// Agents frequently re-request dashboard stats within a single conversation.
+// A short-lived per-user cache lets repeated calls skip the database entirely;
+// write tools invalidate their user's entry so stats reflect same-conversation
+// mutations.
+const STATS_CACHE_TTL_MS = 30 * 1000;
+const statsCache = new Map<number, { stats: any; cachedAt: number }>();
+
+/**
+ * Clear memoized tool results (e.g. between agent tasks or after bulk writes)
+ */
+export function clearToolCaches(): void {
+  statsCache.clear();
+}
+
 export const getDashboardStatsTool: AITool = {
   name: 'get_dashboard_stats',
   description: 'Get CRM dashboard statistics',
@@ -376,23 +393,21 @@ export const getDashboardStatsTool: AITool = {
     required: [],
   },
   execute: async (params, context) => {
-    const [contactCount] = await Promise.all([
-      dbGet('SELECT COUNT(*) as count FROM contacts WHERE user_id = ?', [context.userId]),
-    ]);
+    const cached = statsCache.get(context.userId)
+    if (cached && Date.now() - cached.cachedAt < STATS_CACHE_TTL_MS) {
+      return cached.stats
+    }
 
-    const [dealCount] = await Promise.all([
+    // The four stat queries are independent reads; run them concurrently on
+    // the pool instead of awaiting each in turn
+    const [contactCount, dealCount, dealValue, openTasks] = await Promise.all([
+      dbGet('SELECT COUNT(*) as count FROM contacts WHERE user_id = ?', [context.userId]),
       dbGet('SELECT COUNT(*) as count FROM deals WHERE user_id = ?', [context.userId]),
+      dbGet('SELECT SUM(value) as total FROM deals WHERE user_id = ? AND stage != \'Closed Lost\'', [context.userId]),
+      dbGet('SELECT COUNT(*) as count FROM tasks WHERE user_id = ? AND status = \'Open\'', [context.userId]),
     ]);
 
-    const [dealValue] = await Promise.all([
-      dbGet('SELECT SUM(value) as total FROM deals WHERE user_id = ? AND stage != "Closed Lost"', [context.userId]),
-    ]);
-
-    const [openTasks] = await Promise.all([
-      dbGet('SELECT COUNT(*) as count FROM tasks WHERE user_id = ? AND status = "Open"', [context.userId]),
-    ]);
-
-    return {
+    const stats = {
       success: true,
       stats: {
         totalContacts: contactCount?.count || 0,
@@ -401,6 +416,9 @@ export const getDashboardStatsTool: AITool = {
         openTasks: openTasks?.count || 0,
       },
     };
+
+    statsCache.set(context.userId, { stats, cachedAt: Date.now() });
+    return stats;
   },
 };
 
@@ -419,16 +437,19 @@ export const getUpcomingTasksTool: AITool = {
     const days = params.days || 7;
     const limit = params.limit || 20;
 
+    // The look-ahead window is bound as a parameter (computed once per query)
+    // instead of being spliced into the SQL text, so every days value shares
+    // one cached statement skeleton
     const tasks = await dbAll(
       `SELECT t.*, c.first_name, c.last_name, d.name as deal_name
        FROM tasks t
        LEFT JOIN contacts c ON t.contact_id = c.id
        LEFT JOIN deals d ON t.deal_id = d.id
        WHERE t.user_id = ? AND t.status = 'Open'
-       AND t.due_date BETWEEN date('now') AND date('now', '+${days} days')
+       AND t.due_date BETWEEN NOW() AND NOW() + make_interval(days => ?)
        ORDER BY t.due_date ASC, t.priority DESC
        LIMIT ?`,
-      [context.userId, limit]
+      [context.userId, days, limit]
     );
 
     return {
@@ -552,42 +573,95 @@ export const getContactDetailsTool: AITool = {
     required: ['contactId'],
   },
   execute: async (params, context) => {
-    const contact = await dbGet(
-      `SELECT * FROM contacts WHERE id = ? AND user_id = ?`,
-      [params.contactId, context.userId]
+    // Contact, deals, recent activities, and open tasks fetched in a single
+    // round trip: each section is aggregated to JSON inside PostgreSQL
+    // instead of issuing four sequential queries per tool call
+    const row = await dbGet(
+      `SELECT
+         (SELECT row_to_json(c) FROM contacts c
+           WHERE c.id = ? AND c.user_id = ?) AS contact,
+         (SELECT COALESCE(json_agg(d), '[]'::json) FROM deals d
+           WHERE d.contact_id = ? AND d.user_id = ?) AS deals,
+         (SELECT COALESCE(json_agg(a), '[]'::json) FROM (
+            SELECT * FROM activities
+            WHERE contact_id = ? AND user_id = ?
+            ORDER BY created_at DESC LIMIT 10
+          ) a) AS activities,
+         (SELECT COALESCE(json_agg(t), '[]'::json) FROM (
+            SELECT * FROM tasks
+            WHERE contact_id = ? AND user_id = ? AND status = 'Open'
+            ORDER BY due_date ASC
+          ) t) AS tasks`,
+      [
+        params.contactId, context.userId,
+        params.contactId, context.userId,
+        params.contactId, context.userId,
+        params.contactId, context.userId,
+      ]
     );
 
-    if (!contact) {
+    if (!row?.contact) {
       return {
         success: false,
         error: 'Contact not found',
       };
     }
 
-    // Get related deals
-    const deals = await dbAll(
-      `SELECT * FROM deals WHERE contact_id = ? AND user_id = ?`,
-      [params.contactId, context.userId]
-    );
+    return {
+      success: true,
+      contact: row.contact,
+      deals: row.deals,
+      activities: row.activities,
+      tasks: row.tasks,
+    };
+  },
+};
 
-    // Get recent activities
-    const activities = await dbAll(
-      `SELECT * FROM activities WHERE contact_id = ? AND user_id = ? ORDER BY created_at DESC LIMIT 10`,
-      [params.contactId, context.userId]
-    );
+export const getContactsDetailsBatchTool: AITool = {
+  name: 'get_contacts_details_batch',
+  description:
+    'Get details (with deals and recent activities) for several contacts at once. Prefer this over repeated get_contact_details calls when looking up multiple contacts.',
+  parameters: {
+    type: 'object',
+    properties: {
+      contactIds: {
+        type: 'array',
+        items: { type: 'number' },
+        description: 'Contact IDs to look up',
+      },
+    },
+    required: ['contactIds'],
+  },
+  execute: async (params, context) => {
+    const contactIds: number[] = params.contactIds || [];
 
-    // Get tasks
-    const tasks = await dbAll(
-      `SELECT * FROM tasks WHERE contact_id = ? AND user_id = ? AND status = 'Open' ORDER BY due_date ASC`,
-      [params.contactId, context.userId]
+    if (contactIds.length === 0) {
+      return {
+        success: false,
+        error: 'contactIds must contain at least one ID',
+      };
+    }
+
+    // One round trip for the whole batch: deals and recent activities are
+    // aggregated per contact inside PostgreSQL
+    const contacts = await dbAll(
+      `SELECT c.*,
+         (SELECT COALESCE(json_agg(d), '[]'::json) FROM deals d
+           WHERE d.contact_id = c.id AND d.user_id = ?) AS deals,
+         (SELECT COALESCE(json_agg(a), '[]'::json) FROM (
+            SELECT * FROM activities
+            WHERE contact_id = c.id AND user_id = ?
+            ORDER BY created_at DESC LIMIT 10
+          ) a) AS recent_activities
+       FROM contacts c
+       WHERE c.id = ANY(?) AND c.user_id = ?`,
+      [context.userId, context.userId, contactIds, context.userId]
     );
 
     return {
       success: true,
-      contact: contact,
-      deals: deals,
-      activities: activities,
-      tasks: tasks,
+      count: contacts.length,
+      contacts: contacts,
     };
   },
 };
@@ -602,6 +676,7 @@ export const ALL_TOOLS: AITool[] = [
   updateContactTool,
   searchContactsTool,
   getContactDetailsTool,
+  getContactsDetailsBatchTool,
 
   // Deal tools
   createDealTool,
@@ -629,10 +704,18 @@ export function getToolByName(name: string): AITool | undefined {
   return ALL_TOOLS.find((tool) => tool.name === name);
 }
 
+// Tool definitions never change at runtime, so build the Claude-facing
+// payload once instead of re-mapping ALL_TOOLS on every API call
+let toolDefinitionsCache: Array<{ name: string; description: string; input_schema: any }> | null =
+  null;
+
 export function getAllToolDefinitions() {
-  return ALL_TOOLS.map((tool) => ({
-    name: tool.name,
-    description: tool.description,
-    input_schema: tool.parameters, // Claude API expects "input_schema" not "parameters"
-  }));
+  if (!toolDefinitionsCache) {
+    toolDefinitionsCache = ALL_TOOLS.map((tool) => ({
+      name: tool.name,
+      description: tool.description,
+      input_schema: tool.parameters, // Claude API expects "input_schema" not "parameters"
+    }));
+  }
+  return toolDefinitionsCache;
 }
@@ -7,6 +7,40 @@
 import { getPool } from '../database/postgresql/pool'
 import { logger } from './logging/logger'
 
+// Cache of SQLite -> PostgreSQL translations. AI tools fire the same query
+// skeletons repeatedly, so translating (and regex-scanning) the SQL once per
+// distinct statement instead of once per call keeps the hot path cheap.
+const translationCache = new Map<string, string>()
+const TRANSLATION_CACHE_MAX = 256
+
+/**
+ * Translate a SQLite-style query to PostgreSQL syntax.
+ * Converts datetime('now') to NOW() and ? placeholders to $1, $2, etc.
+ * Results are memoized since tool queries reuse a small set of skeletons.
+ */
+function translateSql(sql: string): string {
+  const cached = translationCache.get(sql)
+  if (cached !== undefined) {
+    return cached
+  }
+
+  let paramIndex = 1
+  const pgSql = sql
+    .replace(/datetime\('now'\)/g, 'NOW()')
+    .replace(/\?/g, () => `$${paramIndex++}`)
+
+  if (translationCache.size >= TRANSLATION_CACHE_MAX) {
+    translationCache.clear()
+  }
+  translationCache.set(sql, pgSql)
+
+  return pgSql
+}
+
+// Detect INSERT statements without allocating trimmed/uppercased copies of
+// the SQL on every write call
+const INSERT_PATTERN = /^\s*insert\b/i
+
 /**
  * Execute a query that modifies data (INSERT, UPDATE, DELETE)
  * Compatible with SQLite-style queries but executes on PostgreSQL
@@ -18,15 +52,10 @@ export async function dbRun(
   try {
     const pool = getPool()
 
-    // Convert SQLite datetime('now') to PostgreSQL NOW()
-    // Convert SQLite-style placeholders (?) to PostgreSQL-style ($1, $2, etc.)
-    let paramIndex = 1
-    const pgSql = sql
-      .replace(/datetime\('now'\)/g, 'NOW()')
-      .replace(/\?/g, () => `$${paramIndex++}`)
+    const pgSql = translateSql(sql)
 
     // For INSERT queries, try to return the inserted ID
-    if (sql.trim().toUpperCase().startsWith('INSERT')) {
+    if (INSERT_PATTERN.test(sql)) {
       const result = await pool.query(pgSql + ' RETURNING id', params)
       return {
         lastID: result.rows[0]?.id,
@@ -55,9 +84,7 @@ export async function dbGet<T = any>(
   try {
     const pool = getPool()
 
-    // Convert SQLite-style placeholders to PostgreSQL-style
-    let paramIndex = 1
-    const pgSql = sql.replace(/\?/g, () => `$${paramIndex++}`)
+    const pgSql = translateSql(sql)
 
     const result = await pool.query(pgSql, params)
     return result.rows[0] as T | undefined
@@ -77,9 +104,7 @@ export async function dbAll<T = any>(
   try {
     const pool = getPool()
 
-    // Convert SQLite-style placeholders to PostgreSQL-style
-    let paramIndex = 1
-    const pgSql = sql.replace(/\?/g, () => `$${paramIndex++}`)
+    const pgSql = translateSql(sql)
 
     const result = await pool.query(pgSql, params)
     return result.rows as T[]
@@ -115,6 +115,12 @@ export function logSafe(level: string, message: string, meta?: any): void {
   }
 }
 
+// Single compiled pattern so each key is scanned once for all sensitive
+// markers, instead of one substring search per marker per key. Variants like
+// passwordHash and accessToken are covered by the password/token alternatives,
+// and the case-insensitive flag removes the per-key toLowerCase allocation.
+const SENSITIVE_LOG_KEY_PATTERN = /password|token|secret|apikey|creditcard|ssn|authorization/i
+
 /**
  * Sanitize log data to remove sensitive information
  */
@@ -123,23 +129,10 @@ function sanitizeLogData(data: any): any {
     return data
   }
 
-  const sensitiveKeys = [
-    'password',
-    'passwordHash',
-    'token',
-    'accessToken',
-    'refreshToken',
-    'secret',
-    'apiKey',
-    'creditCard',
-    'ssn',
-    'authorization',
-  ]
-
   const sanitized = Array.isArray(data) ? [...data] : { ...data }
 
   for (const key in sanitized) {
-    if (sensitiveKeys.some((sensitive) => key.toLowerCase().includes(sensitive))) {
+    if (SENSITIVE_LOG_KEY_PATTERN.test(key)) {
       sanitized[key] = '***REDACTED***'
     } else if (typeof sanitized[key] === 'object') {
       sanitized[key] = sanitizeLogData(sanitized[key])
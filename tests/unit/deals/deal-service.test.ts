@@ -403,11 +403,23 @@ describe('DealService', () => {
         { ...mockDeal, id: 'deal-3', isClosed: true, isWon: false, amount: 20000 },
       ]
 
+      mockedDealRepo.getStatisticsAggregates.mockResolvedValue({
+        totalDeals: 3,
+        openDeals: 1,
+        closedDeals: 2,
+        wonDeals: 1,
+        lostDeals: 1,
+        totalValue: 100000,
+        wonValue: 30000,
+        lostValue: 20000,
+        weightedPipelineValue: 55000,
+      })
+
       mockedDealRepo.list.mockResolvedValue({
         deals,
         total: 3,
         page: 1,
-        limit: 10000,
+        limit: 10,
         totalPages: 1,
       })
 